@@ -54,6 +54,8 @@ class SupportsMerge(Protocol):
 
 
 class MergeMixin:
+    __slots__ = ()
+
     def merge(self, other: Mapping[Any, SupportsMerge]) -> bool:
         """Merge values from the given dict-like object."""
         for key, value in other.items():
@@ -66,6 +68,8 @@ class MergeMixin:
 
 
 class MatchMixin:
+    __slots__ = ()
+
     def match(self, *patterns: str) -> Set[str]:
         """Return keys matching the given path patterns."""
         spec = PathSpec.from_lines("gitwildmatch", patterns)
@@ -120,6 +124,8 @@ class Pin(Generic[K, CV]):
 class Container(MutableMapping[K, V]):
     """Generic dict-like container."""
 
+    __slots__ = ("_wrapped",)
+
     _wrapped: Dict[K, V]
 
     def __init__(self):
@@ -181,6 +187,8 @@ class Container(MutableMapping[K, V]):
 class ContainerProxy(Generic[ProxyKeyType, K, V], MutableMapping[K, V]):
     """Generic aggregated view over several nested bounded dict-like objects."""
 
+    __slots__ = ("proxy", "proxy_key")
+
     proxy: Mapping[K, Mapping[ProxyKeyType, MutableMapping[K, V]]]
     proxy_key: ProxyKeyType
 
@@ -22,8 +22,10 @@ __all__ = [
 
 
 import io
-import json
+import locale
+import os
 import shutil
+import sys
 from copy import deepcopy
 from dataclasses import dataclass, replace
 from pathlib import Path
@@ -34,11 +36,12 @@ from typing import (
     Generic,
     Mapping,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 import yaml
 from pydantic import BaseModel, ValidationError
@@ -65,6 +68,7 @@ from .utils import (
     dump_json,
     extra_field,
     format_validation_error,
+    load_json,
     snake_case,
 )
 
@@ -86,6 +90,7 @@ class File(Generic[ValueType, SerializeType]):
 
     source_start: Optional[int] = extra_field(default=None)
     source_stop: Optional[int] = extra_field(default=None)
+    source_zip: Optional[Tuple[ZipFile, str]] = extra_field(default=None)
 
     on_bind: Optional[Callable[[Any, Any, str], Any]] = extra_field(default=None)
 
@@ -98,7 +103,7 @@ class File(Generic[ValueType, SerializeType]):
     original: "File[ValueType, SerializeType]" = extra_field(default=None)
 
     def __post_init__(self):
-        if self._content is self.source_path is None:
+        if self._content is self.source_path is self.source_zip is None:
             self._content = self.default()
         if not self.reader:  # type: ignore
             self.reader = self.from_path
@@ -116,15 +121,18 @@ class File(Generic[ValueType, SerializeType]):
 
     def set_content(self, content: Union[ValueType, SerializeType]):
         """Update the internal content."""
-        if self.source_path:
+        if self.source_path or self.source_zip:
             self.original = replace(self, original=None)
             self.source_path = None
             self.source_start = None
             self.source_stop = None
+            self.source_zip = None
         self._content = content
 
     def get_content(self) -> Union[ValueType, SerializeType]:
         """Return the internal content."""
+        if self._content is None and self.source_zip:
+            return self.from_zip(*self.source_zip)
         return (
             self.reader(
                 self.ensure_source_path(),
@@ -187,6 +195,12 @@ class File(Generic[ValueType, SerializeType]):
 
         return (
             (
+                self.source_zip is not None
+                and other.source_zip is not None
+                and self.source_zip[0] is other.source_zip[0]
+                and self.source_zip[1] == other.source_zip[1]
+            )
+            or (
                 self.source_path is not None
                 and self.source_path == other.source_path
                 and (0 if self.source_start is None else self.source_start)
@@ -277,7 +291,8 @@ class File(Generic[ValueType, SerializeType]):
         """Write the file to a zipfile or to the filesystem."""
         if isinstance(origin, Mapping):
             raise TypeError(f'Can\'t dump file "{path}" to read-only mapping.')
-        if self._content is None:
+        ranged = self.source_start is not None or self.source_stop is not None
+        if self._content is self.source_zip is None and not ranged:
             if isinstance(origin, ZipFile):
                 origin.write(self.ensure_source_path(), str(path))
             else:
@@ -297,6 +312,8 @@ class File(Generic[ValueType, SerializeType]):
             + (self.source_start is not None) * f", source_start={self.source_start}"
             + (self.source_stop is not None) * f", source_stop={self.source_stop}"
             if self.source_path
+            else f"source_zip={self.source_zip[1]!r}"
+            if self.source_zip
             else ""
         )
         return f"{self.__class__.__name__}({content})"
@@ -415,14 +432,16 @@ class TextFileBase(File[ValueType, str]):
             f.write(raw)
 
     def dump_zip(self, origin: ZipFile, name: str, raw: str) -> None:
-        with origin.open(name, "w") as f:
-            with io.TextIOWrapper(
-                f,
-                encoding=self.encoding,
-                errors=self.errors,
-                newline=self.newline,
-            ) as text_io:
-                text_io.write(raw)
+        newline = os.linesep if self.newline is None else self.newline
+        if newline and newline != "\n":
+            raw = raw.replace("\n", newline)
+        origin.writestr(
+            _zip_info(origin, name),
+            raw.encode(
+                self.encoding or locale.getpreferredencoding(False),
+                self.errors or "strict",
+            ),
+        )
 
     def to_str(self, content: ValueType) -> str:
         """Convert content to string."""
@@ -487,13 +506,27 @@ class BinaryFileBase(File[ValueType, bytes]):
     def from_zip(cls, origin: ZipFile, name: str) -> bytes:
         return origin.read(name)
 
+    def dump(self, origin: FileOrigin, path: FileSystemPath):
+        if (
+            self._content is self.source_zip is None
+            and self.reader == self.from_path
+            and not isinstance(origin, (ZipFile, Mapping))
+        ):
+            _copy_range(
+                self.ensure_source_path(),
+                Path(origin, path),
+                0 if self.source_start is None else self.source_start,
+                -1 if self.source_stop is None else self.source_stop,
+            )
+        else:
+            super().dump(origin, path)
+
     def dump_path(self, path: FileSystemPath, raw: bytes) -> None:
         with open(path, "wb") as f:
             f.write(raw)
 
     def dump_zip(self, origin: ZipFile, name: str, raw: bytes) -> None:
-        with origin.open(name, "w") as f:
-            f.write(raw)
+        origin.writestr(_zip_info(origin, name), raw)
 
     def to_bytes(self, content: ValueType) -> bytes:
         """Convert content to bytes."""
@@ -579,7 +612,7 @@ class JsonFileBase(DataModelBase[ValueType]):
         if not self.encoder:  # type: ignore
             self.encoder = dump_json
         if not self.decoder:  # type: ignore
-            self.decoder = json.loads
+            self.decoder = load_json
 
 
 @dataclass(eq=False, repr=False)
@@ -632,3 +665,43 @@ class PngFile(BinaryFileBase[Image]):
     @classmethod
     def default(cls) -> Image:
         return new_image("RGBA", (16, 16), "magenta")
+
+
+def _zip_info(origin: ZipFile, name: str) -> ZipInfo:
+    # Same entry as ZipFile.open(name, "w"), keeping the fixed 1980 timestamp
+    # so that zipped output stays reproducible.
+    info = ZipInfo(name)
+    info.compress_type = origin.compression
+    info._compresslevel = origin.compresslevel  # type: ignore
+    return info
+
+
+def _copy_range(source: FileSystemPath, path: FileSystemPath, start: int, stop: int):
+    if start == 0 and stop == -1:
+        shutil.copyfile(source, path)
+        return
+
+    with open(source, "rb") as fsrc, open(path, "wb") as fdst:
+        if stop == -1:
+            stop = os.fstat(fsrc.fileno()).st_size
+
+        if _USE_SENDFILE:
+            offset = start
+            try:
+                while offset < stop:
+                    sent = os.sendfile(
+                        fdst.fileno(), fsrc.fileno(), offset, stop - offset
+                    )
+                    if not sent:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                fdst.seek(0)
+                fdst.truncate()
+
+        fsrc.seek(start)
+        fdst.write(fsrc.read(max(stop - start, 0)))
+
+
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
@@ -4,6 +4,7 @@ __all__ = [
     "Sentinel",
     "SENTINEL_OBJ",
     "dump_json",
+    "load_json",
     "extra_field",
     "required_field",
     "intersperse",
@@ -56,6 +57,11 @@ from typing import (
 from pydantic import PydanticTypeError, ValidationError
 from pydantic.validators import _VALIDATORS  # type: ignore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 T = TypeVar("T")
 
 
@@ -78,10 +84,40 @@ class Sentinel:
 SENTINEL_OBJ = Sentinel()
 
 
+JSON_STDLIB_ONLY_REGEX = re.compile(rb"\d[eE]|0\.0000|null|\x7f")
+JSON_BIG_INT_REGEX = re.compile(r"\d{19}")
+
+
 def dump_json(value: Any) -> str:
+    if orjson:
+        try:
+            raw = orjson.dumps(
+                value,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except TypeError:
+            pass
+        else:
+            # Only use the output when it's identical to the stdlib encoder.
+            if raw.isascii() and not JSON_STDLIB_ONLY_REGEX.search(raw):
+                return raw.decode()
     return json.dumps(value, indent=2) + "\n"
 
 
+def load_json(content: str) -> Any:
+    # Orjson silently turns integers outside of the 64-bit range into floats.
+    if orjson and not JSON_BIG_INT_REGEX.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 def extra_field(**kwargs: Any) -> Any:
     return field(repr=False, hash=False, compare=False, **kwargs)
 
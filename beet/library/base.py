@@ -24,13 +24,20 @@ __all__ = [
 ]
 
 
+import hashlib
+import io
+import os
 import shutil
+import sys
+import threading
 from collections import defaultdict
-from contextlib import nullcontext
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
-from functools import partial
+from functools import lru_cache, partial
 from itertools import count
 from pathlib import Path, PurePosixPath
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
@@ -46,6 +53,7 @@ from typing import (
     MutableMapping,
     Optional,
     Protocol,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -55,6 +63,8 @@ from typing import (
     get_origin,
     overload,
 )
+from urllib.parse import unquote, urlparse
+from urllib.request import Request, urlopen
 from zipfile import ZIP_BZIP2, ZIP_DEFLATED, ZIP_LZMA, ZIP_STORED, ZipFile
 
 from beet.core.container import (
@@ -66,7 +76,7 @@ from beet.core.container import (
     Pin,
     SupportsMerge,
 )
-from beet.core.file import File, FileOrigin, JsonFile, PngFile
+from beet.core.file import BinaryFileBase, File, FileOrigin, JsonFile, PngFile
 from beet.core.utils import FileSystemPath, JsonDict, TextComponent
 
 from .utils import list_extensions, list_files
@@ -84,6 +94,8 @@ MergeableType = TypeVar("MergeableType", bound=SupportsMerge)
 
 PackFile = File[Any, Any]
 
+_max_workers: int = os.cpu_count() or 1
+
 
 PACK_COMPRESSION: Dict[str, int] = {
     "none": ZIP_STORED,
@@ -107,6 +119,7 @@ class NamespaceFile(Protocol):
         source_path: Optional[FileSystemPath] = None,
         source_start: Optional[int] = None,
         source_stop: Optional[int] = None,
+        source_zip: Optional[Tuple[ZipFile, str]] = None,
         on_bind: Optional[Callable[[Any, Any, str], Any]] = None,
         original: Any = None,
     ) -> None:
@@ -158,15 +171,37 @@ class MergeCallback(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class MergePolicy:
     """Class holding lists of rules for merging files."""
 
-    extra: Dict[str, List[MergeCallback]] = field(default_factory=dict)
+    extra: Dict[str, List[MergeCallback]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
     namespace: Dict[Type[NamespaceFile], List[MergeCallback]] = field(
-        default_factory=dict
+        default_factory=lambda: defaultdict(list)
+    )
+    namespace_extra: Dict[str, List[MergeCallback]] = field(
+        default_factory=lambda: defaultdict(list)
     )
-    namespace_extra: Dict[str, List[MergeCallback]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not isinstance(self.extra, defaultdict):
+            self.extra = defaultdict(list, self.extra)
+        if not isinstance(self.namespace, defaultdict):
+            self.namespace = defaultdict(list, self.namespace)
+        if not isinstance(self.namespace_extra, defaultdict):
+            self.namespace_extra = defaultdict(list, self.namespace_extra)
+
+    def copy(self) -> "MergePolicy":
+        """Copy the merge policy."""
+        return MergePolicy(
+            extra=defaultdict(list, {k: [*v] for k, v in self.extra.items()}),
+            namespace=defaultdict(list, {k: [*v] for k, v in self.namespace.items()}),
+            namespace_extra=defaultdict(
+                list, {k: [*v] for k, v in self.namespace_extra.items()}
+            ),
+        )
 
     def extend(self, other: "MergePolicy"):
         for rules, other_rules in [
@@ -175,38 +210,52 @@ class MergePolicy:
             (self.namespace_extra, other.namespace_extra),
         ]:
             for key, value in other_rules.items():
-                rules.setdefault(key, []).extend(value)  # type: ignore
+                rules[key].extend(value)  # type: ignore
 
     def extend_extra(self, filename: str, rule: MergeCallback):
         """Add rule for merging extra files."""
-        self.extra.setdefault(filename, []).append(rule)
+        self.extra[filename].append(rule)
 
     def extend_namespace(self, file_type: Type[NamespaceFile], rule: MergeCallback):
         """Add rule for merging namespace files."""
-        self.namespace.setdefault(file_type, []).append(rule)
+        self.namespace[file_type].append(rule)
 
     def extend_namespace_extra(self, filename: str, rule: MergeCallback):
         """Add rule for merging namespace extra files."""
-        self.namespace_extra.setdefault(filename, []).append(rule)
+        self.namespace_extra[filename].append(rule)
 
     def merge_with_rules(
         self,
         pack: Any,
         current: MutableMapping[Any, SupportsMerge],
         other: Mapping[Any, SupportsMerge],
-        map_rules: Callable[[str], Tuple[str, List[MergeCallback]]],
+        rules: Sequence[MergeCallback] = (),
+        rules_by_key: Optional[Mapping[str, List[MergeCallback]]] = None,
+        namespace: Optional[str] = None,
     ) -> bool:
         """Merge values according to the given rules."""
+        if not rules and not rules_by_key:
+            current_get = current.get
+            for key, value in other.items():
+                try:
+                    current_value = current_get(key)
+                    if current_value is None or not current_value.merge(value):
+                        current[key] = value
+                except Drop:
+                    del current[key]
+            return True
+
         for key, value in other.items():
             if key not in current:
                 current[key] = value
                 continue
 
             current_value = current[key]
-            path, rules = map_rules(key)
+            path = f"{namespace}:{key}" if namespace else key
+            key_rules = rules if rules_by_key is None else rules_by_key.get(key, ())
 
             try:
-                for rule in rules:
+                for rule in key_rules:
                     if rule(pack, path, current_value, value):
                         break
                 else:
@@ -221,6 +270,8 @@ class MergePolicy:
 class ExtraContainer(MatchMixin, MergeMixin, Container[str, PackFile]):
     """Container that stores extra files in a pack or a namespace."""
 
+    __slots__ = ()
+
 
 class SupportsExtra(Protocol):
     """Protocol for detecting extra container."""
@@ -238,44 +289,47 @@ class ExtraPin(Pin[str, PinType]):
 class NamespaceExtraContainer(ExtraContainer, Generic[NamespaceType]):
     """Namespace extra container."""
 
-    namespace: Optional[NamespaceType] = None
+    __slots__ = ("namespace",)
+
+    namespace: Optional[NamespaceType]
+
+    def __init__(self):
+        super().__init__()
+        self.namespace = None
 
     def process(self, key: str, value: PackFile) -> PackFile:
-        if (
-            self.namespace is not None
-            and self.namespace.pack is not None
-            and self.namespace.name
-        ):
-            value.bind(self.namespace.pack, f"{self.namespace.name}:{key}")
+        namespace = self.namespace
+        if namespace is not None and namespace.pack is not None and namespace.name:
+            value.bind(namespace.pack, f"{namespace.name}:{key}")
         return value
 
     def bind(self, namespace: NamespaceType):
         """Handle insertion."""
         self.namespace = namespace
 
+        pack = namespace.pack
+        name = namespace.name
+        if pack is None or not name:
+            return
+
         for key, value in self.items():
             try:
-                self.process(key, value)
+                value.bind(pack, f"{name}:{key}")
             except Drop:
                 del self[key]
 
     def merge(self, other: Mapping[Any, SupportsMerge]) -> bool:
-        if (
-            self.namespace is not None
-            and self.namespace.pack is not None
-            and self.namespace.name
-        ):
-            pack = self.namespace.pack
-            name = self.namespace.name
+        namespace = self.namespace
+        if namespace is not None and namespace.pack is not None and namespace.name:
+            pack = namespace.pack
+            merge_policy = pack.merge_policy
 
-            return pack.merge_policy.merge_with_rules(
+            return merge_policy.merge_with_rules(
                 pack=pack,
                 current=self,  # type: ignore
                 other=other,
-                map_rules=lambda key: (
-                    f"{name}:{key}",
-                    pack.merge_policy.namespace_extra.get(key, []),
-                ),
+                rules_by_key=merge_policy.namespace_extra,
+                namespace=namespace.name,
             )
         return super().merge(other)
 
@@ -283,7 +337,13 @@ class NamespaceExtraContainer(ExtraContainer, Generic[NamespaceType]):
 class PackExtraContainer(ExtraContainer, Generic[PackType]):
     """Pack extra container."""
 
-    pack: Optional[PackType] = None
+    __slots__ = ("pack",)
+
+    pack: Optional[PackType]
+
+    def __init__(self):
+        super().__init__()
+        self.pack = None
 
     def process(self, key: str, value: PackFile) -> PackFile:
         if self.pack is not None:
@@ -296,22 +356,19 @@ class PackExtraContainer(ExtraContainer, Generic[PackType]):
 
         for key, value in self.items():
             try:
-                self.process(key, value)
+                value.bind(pack, key)
             except Drop:
                 del self[key]
 
     def merge(self, other: Mapping[Any, SupportsMerge]) -> bool:
-        if self.pack is not None:
-            pack = self.pack
+        if (pack := self.pack) is not None:
+            merge_policy = pack.merge_policy
 
-            return pack.merge_policy.merge_with_rules(
+            return merge_policy.merge_with_rules(
                 pack=pack,
                 current=self,  # type: ignore
                 other=other,
-                map_rules=lambda key: (
-                    key,
-                    pack.merge_policy.extra.get(key, []),
-                ),
+                rules_by_key=merge_policy.extra,
             )
         return super().merge(other)
 
@@ -319,16 +376,20 @@ class PackExtraContainer(ExtraContainer, Generic[PackType]):
 class NamespaceContainer(MatchMixin, MergeMixin, Container[str, NamespaceFileType]):
     """Container that stores one type of files in a namespace."""
 
-    namespace: Optional["Namespace"] = None
-    file_type: Optional[Type[NamespaceFileType]] = None
+    __slots__ = ("namespace", "file_type")
+
+    namespace: Optional["Namespace"]
+    file_type: Optional[Type[NamespaceFileType]]
+
+    def __init__(self):
+        super().__init__()
+        self.namespace = None
+        self.file_type = None
 
     def process(self, key: str, value: NamespaceFileType) -> NamespaceFileType:
-        if (
-            self.namespace is not None
-            and self.namespace.pack is not None
-            and self.namespace.name
-        ):
-            value.bind(self.namespace.pack, f"{self.namespace.name}:{key}")
+        namespace = self.namespace
+        if namespace is not None and namespace.pack is not None and namespace.name:
+            value.bind(namespace.pack, f"{namespace.name}:{key}")
         return value
 
     def bind(self, namespace: "Namespace", file_type: Type[NamespaceFileType]):
@@ -336,9 +397,14 @@ class NamespaceContainer(MatchMixin, MergeMixin, Container[str, NamespaceFileTyp
         self.namespace = namespace
         self.file_type = file_type
 
+        pack = namespace.pack
+        name = namespace.name
+        if pack is None or not name:
+            return
+
         for key, value in self.items():
             try:
-                self.process(key, value)
+                value.bind(pack, f"{name}:{key}")
             except Drop:
                 del self[key]
 
@@ -360,24 +426,23 @@ class NamespaceContainer(MatchMixin, MergeMixin, Container[str, NamespaceFileTyp
         return self[key]
 
     def merge(self, other: Mapping[Any, SupportsMerge]) -> bool:
+        namespace = self.namespace
+        file_type = self.file_type
         if (
-            self.namespace is not None
-            and self.namespace.pack is not None
-            and self.namespace.name
-            and self.file_type is not None
+            namespace is not None
+            and namespace.pack is not None
+            and namespace.name
+            and file_type is not None
         ):
-            pack = self.namespace.pack
-            name = self.namespace.name
-            file_type = self.file_type
+            pack = namespace.pack
+            merge_policy = pack.merge_policy
 
-            return pack.merge_policy.merge_with_rules(
+            return merge_policy.merge_with_rules(
                 pack=pack,
                 current=self,  # type: ignore
                 other=other,
-                map_rules=lambda key: (
-                    f"{name}:{key}",
-                    pack.merge_policy.namespace.get(file_type, []),
-                ),
+                rules=merge_policy.namespace.get(file_type, ()),
+                namespace=namespace.name,
             )
         return super().merge(other)
 
@@ -422,9 +487,9 @@ class Namespace(
     def __init_subclass__(cls):
         pins = NamespacePin[NamespaceFileType].collect_from(cls)
         cls.field_map = {pin.key: attr for attr, pin in pins.items()}
-        cls.scope_map = {
-            (pin.key.scope, pin.key.extension): pin.key for pin in pins.values()
-        }
+        cls.scope_map = MappingProxyType(
+            {(pin.key.scope, pin.key.extension): pin.key for pin in pins.values()}
+        )
 
     def __init__(self):
         super().__init__()
@@ -473,11 +538,11 @@ class Namespace(
             return False
         if isinstance(other, Mapping):
             rhs: Mapping[Type[NamespaceFile], NamespaceContainer[NamespaceFile]] = other
-            return all(self[key] == rhs[key] for key in self.keys() | rhs.keys())
+            return all(self[key] == rhs[key] for key in _ordered_keys(self, rhs))
         return NotImplemented
 
     def __bool__(self) -> bool:
-        return any(self.values()) or bool(self.extra)
+        return bool(self.extra) or any(self.values())
 
     def missing(self, key: Type[NamespaceFile]) -> NamespaceContainer[NamespaceFile]:
         return NamespaceContainer()
@@ -486,7 +551,7 @@ class Namespace(
         self: MutableMapping[T, MergeableType],  # type: ignore
         other: Mapping[T, MergeableType],
     ) -> bool:
-        super().merge(other)  # type: ignore
+        super().merge({key: value for key, value in other.items() if value})  # type: ignore
 
         if isinstance(self, Namespace) and isinstance(other, Namespace):
             self.extra.merge(other.extra)
@@ -534,21 +599,24 @@ class Namespace(
         if extend and (origin := get_origin(extend)):
             extend = origin
 
+        namespace_root = f"{self.directory}/{namespace}"
+        extension_set = frozenset(extensions)
+
         for path, item in self.extra.items():
-            if extensions and not any(path.endswith(ext) for ext in extensions):
+            if extensions and not path.endswith(extensions):
                 continue
             if extend and not isinstance(item, extend):
                 continue
-            yield f"{self.directory}/{namespace}/{path}", item
+            yield f"{namespace_root}/{path}", item
 
         for content_type, container in self.items():
             if not container:
                 continue
-            if extensions and content_type.extension not in extensions:
+            if extension_set and content_type.extension not in extension_set:
                 continue
             if extend and not issubclass(content_type, extend):
                 continue
-            prefix = "/".join((self.directory, namespace) + content_type.scope)
+            prefix = "/".join((namespace_root,) + content_type.scope)
             for name, item in container.items():
                 yield f"{prefix}/{name}{content_type.extension}", item
 
@@ -563,6 +631,7 @@ class Namespace(
         origin: FileOrigin,
         extend_namespace: Iterable[Type[NamespaceFile]] = (),
         extend_namespace_extra: Optional[Mapping[str, Type[PackFile]]] = None,
+        lazy: bool = False,
     ) -> Iterator[Tuple[str, "Namespace"]]:
         """Load namespaces by walking through a zipfile or directory."""
         preparts = tuple(filter(None, prefix.split("/")))
@@ -570,70 +639,100 @@ class Namespace(
             return
 
         if isinstance(origin, ZipFile):
-            filenames = map(PurePosixPath, origin.namelist())
+            filenames = [name for name in origin.namelist() if not name.endswith("/")]
         elif isinstance(origin, Mapping):
-            filenames = map(PurePosixPath, origin)
+            filenames = list(origin)
         elif Path(origin).is_file():
-            filenames = [PurePosixPath()]
+            filenames = [""]
         else:
-            filenames = list_files(origin)
+            filenames = [path.as_posix() for path in list_files(origin)]
 
         extra_info = cls.get_extra_info()
         if extend_namespace_extra:
             extra_info.update(extend_namespace_extra)
 
-        scope_map = dict(cls.scope_map)
-        for file_type in extend_namespace:
-            scope_map[file_type.scope, file_type.extension] = file_type
+        scope_map = cls.scope_map
+        if extend_namespace:
+            scope_map = {
+                **scope_map,
+                **{(ft.scope, ft.extension): ft for ft in extend_namespace},
+            }
 
-        name = None
-        namespace = None
+        scope_extensions = {extension for _, extension in scope_map}
 
-        for filename in sorted(filenames):
-            try:
-                directory, namespace_dir, *scope, basename = preparts + filename.parts
-            except ValueError:
-                continue
+        buckets: DefaultDict[str, List[Tuple[Tuple[str, ...], str]]] = defaultdict(list)
 
-            if directory != cls.directory:
-                continue
-            if name != namespace_dir:
-                if name and namespace:
-                    yield name, namespace
-                name, namespace = namespace_dir, cls()
+        for filename in filenames:
+            parts = preparts + tuple(part for part in filename.split("/") if part)
+            if len(parts) > 2 and parts[0] == cls.directory:
+                buckets[parts[1]].append((parts[2:], filename))
 
-            assert name and namespace is not None
-            extensions = list_extensions(PurePosixPath(basename))
+        namespaces: Dict[str, Namespace] = {}
+        pending: List[Tuple[MutableMapping[str, Any], str, Type[Any], str]] = []
 
-            if file_type := extra_info.get(path := "/".join(scope + [basename])):
-                namespace.extra[path] = file_type.load(origin, filename)
-                continue
+        for namespace_dir in sorted(buckets):
+            namespace = namespaces[sys.intern(namespace_dir)] = cls()
 
-            file_dir: List[str] = []
+            for (*scope, basename), filename in sorted(buckets[namespace_dir]):
+                extensions = _list_extensions(basename)
 
-            while path := tuple(scope):
-                for extension in extensions:
-                    if file_type := scope_map.get((path, extension)):
-                        key = "/".join(file_dir + [basename[: -len(extension)]])
-                        namespace[file_type][key] = file_type.load(origin, filename)
-                        break
-                else:
-                    file_dir.insert(0, scope.pop())
+                if file_type := extra_info.get(path := "/".join(scope + [basename])):
+                    pending.append((namespace.extra, path, file_type, filename))
                     continue
-                break
 
-        if name and namespace:
-            yield name, namespace
+                extensions = [ext for ext in extensions if ext in scope_extensions]
+                if not extensions:
+                    continue
+
+                for i in range(len(scope), 0, -1):
+                    scope_key = tuple(scope[:i])
+                    for extension in extensions:
+                        if file_type := scope_map.get((scope_key, extension)):
+                            key = "/".join(scope[i:] + [basename[: -len(extension)]])
+                            container = namespace[file_type]
+                            pending.append((container, key, file_type, filename))
+                            break
+                    else:
+                        continue
+                    break
+
+        if lazy and isinstance(origin, ZipFile):
+            for container, key, file_type, filename in pending:
+                container[key] = file_type(source_zip=(origin, filename))
+        elif isinstance(origin, ZipFile) and len(pending) > 1 and _max_workers > 1:
+            with _thread_local_zipfile(origin) as get_zipfile, ThreadPoolExecutor(
+                max_workers=_max_workers
+            ) as executor:
+
+                def load(entry: Tuple[Any, str, Type[PackFile], str]) -> PackFile:
+                    return entry[2].load(get_zipfile(), entry[3])
 
-    def dump(self, namespace: str, origin: FileOrigin):
+                loaded = executor.map(load, pending)
+                for (container, key, _, _), instance in zip(pending, loaded):
+                    container[key] = instance
+        else:
+            for container, key, file_type, filename in pending:
+                container[key] = file_type.load(origin, filename)
+
+        for name, namespace in namespaces.items():
+            if name and namespace:
+                yield name, namespace
+
+    def dump(
+        self,
+        namespace: str,
+        origin: FileOrigin,
+        executor: Optional[Executor] = None,
+    ):
         """Write the namespace to a zipfile or to the filesystem."""
-        _dump_files(origin, dict(self.list_files(namespace)))
+        _dump_files(origin, self.list_files(namespace), executor)
 
     def __repr__(self) -> str:
+        field_map = self.field_map
         args = ", ".join(
-            f"{self.field_map[key]}={value}"
+            f"{field_map[key]}={value}"
             for key, value in self.items()
-            if key in self.field_map and value
+            if key in field_map and value
         )
         return f"{self.__class__.__name__}({args})"
 
@@ -645,6 +744,8 @@ class NamespaceProxy(
 ):
     """Aggregated view that exposes a certain type of files over all namespaces."""
 
+    __slots__ = ()
+
     def split_key(self, key: str) -> Tuple[str, str]:
         namespace, _, file_path = key.partition(":")
         if not file_path:
@@ -659,28 +760,31 @@ class NamespaceProxy(
         key: str,
         default: Optional[NamespaceFileType] = None,
     ) -> NamespaceFileType:
-        key1, key2 = self.split_key(key)
-        return self.proxy[key1][self.proxy_key].setdefault(key2, default)  # type: ignore
+        namespace, _, file_path = key.partition(":")
+        if not file_path:
+            raise KeyError(key)
+        return self.proxy[namespace][self.proxy_key].setdefault(file_path, default)  # type: ignore
 
     def merge(self, other: Mapping[Any, SupportsMerge]) -> bool:
         if isinstance(pack := self.proxy, Pack):
-            return pack.merge_policy.merge_with_rules(
+            merge_policy = pack.merge_policy
+
+            return merge_policy.merge_with_rules(
                 pack=pack,
                 current=self,  # type: ignore
                 other=other,
-                map_rules=lambda key: (
-                    key,
-                    pack.merge_policy.namespace.get(self.proxy_key, []),
-                ),
+                rules=merge_policy.namespace.get(self.proxy_key, ()),
             )
         return super().merge(other)
 
     def walk(self) -> Iterator[Tuple[str, Set[str], Dict[str, NamespaceFileType]]]:
         """Walk over the file hierarchy."""
+        proxy_key = self.proxy_key
+
         for prefix, namespace in self.proxy.items():
             separator = ":"
             roots: List[Tuple[str, Dict[Any, Any]]] = [
-                (prefix, namespace[self.proxy_key].generate_tree())  # type: ignore
+                (prefix, namespace[proxy_key].generate_tree())  # type: ignore
             ]
 
             while roots:
@@ -692,20 +796,22 @@ class NamespaceProxy(
                 for key, value in root.items():
                     if not isinstance(key, str):
                         continue
-                    if any(isinstance(name, str) for name in value):
-                        dirs.add(key)
-                    if file_instance := value.get(self.proxy_key, None):
+                    for name in value:
+                        if isinstance(name, str):
+                            dirs.add(key)
+                            break
+                    if file_instance := value.get(proxy_key):
                         files[key] = file_instance
 
-                yield prefix + separator, dirs, files
+                path = prefix + separator
+                yield path, dirs, files
 
-                for directory in dirs:
-                    roots.append((prefix + separator + directory, root[directory]))
+                roots.extend((path + directory, root[directory]) for directory in dirs)
 
                 separator = "/"
 
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceProxyDescriptor(Generic[NamespaceFileType]):
     """Descriptor that dynamically instantiates a namespace proxy."""
 
@@ -721,14 +827,15 @@ class Mcmeta(JsonFile):
     """Class representing a pack.mcmeta file."""
 
     def merge(self, other: "Mcmeta") -> bool:  # type: ignore
+        data = self.data
         for key, value in other.data.items():
             if key == "filter":
-                block = self.data.setdefault("filter", {}).setdefault("block", [])
+                block = data.setdefault("filter", {}).setdefault("block", [])
                 for item in value.get("block", []):
                     if item not in block:
                         block.append(item)
             else:
-                self.data[key] = value
+                data[key] = value
         return True
 
 
@@ -749,6 +856,8 @@ class PackPin(McmetaPin[PinType]):
 class UnveilMapping(Mapping[str, FileSystemPath]):
     """Unveil mapping."""
 
+    __slots__ = ("files", "prefix")
+
     files: Mapping[str, FileSystemPath]
     prefix: str
 
@@ -828,6 +937,8 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
 
     merge_policy: MergePolicy
     unveiled: Dict[Union[Path, UnveilMapping], Set[str]]
+    resolve_cache: Dict[str, Tuple[Any, Any]]
+    bind_batch: Optional[DefaultDict[Callable[[Any, List[Any]], Any], List[Any]]]
 
     namespace_type: ClassVar[Type[Namespace]]
     default_name: ClassVar[str]
@@ -877,15 +988,17 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         if filter is not None:
             self.filter = filter
 
-        self.extend_extra = dict(extend_extra or {})
+        self.extend_extra = {**extend_extra} if extend_extra else {}
         self.extend_namespace = list(extend_namespace)
-        self.extend_namespace_extra = dict(extend_namespace_extra or {})
+        self.extend_namespace_extra = (
+            {**extend_namespace_extra} if extend_namespace_extra else {}
+        )
 
-        self.merge_policy = MergePolicy()
-        if merge_policy:
-            self.merge_policy.extend(merge_policy)
+        self.merge_policy = merge_policy.copy() if merge_policy else MergePolicy()
 
         self.unveiled = {}
+        self.resolve_cache = {}
+        self.bind_batch = None
 
         self.load(path or zipfile or mapping)
 
@@ -952,14 +1065,14 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
             return False
         if isinstance(other, Mapping):
             rhs: Mapping[str, Namespace] = other
-            return all(self[key] == rhs[key] for key in self.keys() | rhs.keys())
+            return all(self[key] == rhs[key] for key in _ordered_keys(self, rhs))
         return NotImplemented
 
     def __hash__(self) -> int:
         return id(self)
 
     def __bool__(self) -> bool:
-        return any(self.values()) or self.extra.keys() > {"pack.mcmeta"}
+        return self.extra.keys() > {"pack.mcmeta"} or any(self.values())
 
     def __enter__(self: T) -> T:
         return self
@@ -982,12 +1095,28 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         if isinstance(self, Pack) and isinstance(other, Pack):
             self.extra.merge(other.extra)  # type: ignore
 
-        empty_namespaces = [key for key, value in self.items() if not value]  # type: ignore
-        for namespace in empty_namespaces:
-            del self[namespace]  # type: ignore
+        for namespace in list(self):  # type: ignore
+            if not self[namespace]:  # type: ignore
+                del self[namespace]  # type: ignore
 
         return True
 
+    @contextmanager
+    def batch_bind(self) -> Iterator[None]:
+        """Defer the merges triggered when binding files until the end of the block."""
+        if self.bind_batch is not None:
+            yield
+            return
+
+        self.bind_batch = defaultdict(list)
+
+        try:
+            yield
+        finally:
+            batch, self.bind_batch = self.bind_batch, None
+            for flush, items in batch.items():
+                flush(self, items)
+
     @property
     def content(self) -> Iterator[Tuple[str, NamespaceFile]]:
         """Iterator that yields all the files stored in the pack."""
@@ -1027,7 +1156,7 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
             extend = origin
 
         for path, item in self.extra.items():
-            if extensions and not any(path.endswith(ext) for ext in extensions):
+            if extensions and not path.endswith(extensions):
                 continue
             if extend and not isinstance(item, extend):
                 continue
@@ -1036,29 +1165,64 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         for namespace_name, namespace in self.items():
             yield from namespace.list_files(namespace_name, *extensions, extend=extend)  # type: ignore
 
+    def content_hash(self) -> str:
+        """Compute a sha256 digest of all the files in the pack."""
+        pack_hash = hashlib.sha256()
+
+        for path, item in sorted(self.list_files(), key=lambda entry: entry[0]):
+            pack_hash.update(path.encode())
+            pack_hash.update(b"\0")
+            pack_hash.update(_file_digest(item))
+
+        return pack_hash.hexdigest()
+
     @classmethod
     def get_extra_info(cls) -> Dict[str, Type[PackFile]]:
         return {"pack.mcmeta": Mcmeta, "pack.png": PngFile}
 
-    def resolve_extra_info(self) -> Dict[str, Type[PackFile]]:
+    def resolve_extra_info(self) -> Mapping[str, Type[PackFile]]:
+        key = tuple(self.extend_extra.items())
+        cached = self.resolve_cache.get("extra_info")
+        if cached and cached[0] == key:
+            return cached[1]
+
         extra_info = self.get_extra_info()
         if self.extend_extra:
             extra_info.update(self.extend_extra)
-        return extra_info
+
+        resolved = MappingProxyType(extra_info)
+        self.resolve_cache["extra_info"] = key, resolved
+        return resolved
 
     def resolve_scope_map(
         self,
-    ) -> Dict[Tuple[Tuple[str, ...], str], Type[NamespaceFile]]:
+    ) -> Mapping[Tuple[Tuple[str, ...], str], Type[NamespaceFile]]:
+        key = (self.namespace_type.scope_map, tuple(self.extend_namespace))
+        cached = self.resolve_cache.get("scope_map")
+        if cached and cached[0] == key:
+            return cached[1]
+
         scope_map = dict(self.namespace_type.scope_map)
         for file_type in self.extend_namespace:
             scope_map[file_type.scope, file_type.extension] = file_type
-        return scope_map
 
-    def resolve_namespace_extra_info(self) -> Dict[str, Type[PackFile]]:
+        resolved = MappingProxyType(scope_map)
+        self.resolve_cache["scope_map"] = key, resolved
+        return resolved
+
+    def resolve_namespace_extra_info(self) -> Mapping[str, Type[PackFile]]:
+        key = tuple(self.extend_namespace_extra.items())
+        cached = self.resolve_cache.get("namespace_extra_info")
+        if cached and cached[0] == key:
+            return cached[1]
+
         namespace_extra_info = self.namespace_type.get_extra_info()
         if self.extend_namespace_extra:
             namespace_extra_info.update(self.extend_namespace_extra)
-        return namespace_extra_info
+
+        resolved = MappingProxyType(namespace_extra_info)
+        self.resolve_cache["namespace_extra_info"] = key, resolved
+        return resolved
 
     def load(
         self,
@@ -1067,6 +1231,7 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         extend_namespace: Iterable[Type[NamespaceFile]] = (),
         extend_namespace_extra: Optional[Mapping[str, Type[PackFile]]] = None,
         merge_policy: Optional[MergePolicy] = None,
+        resolve_symlinks: bool = False,
     ):
         """Load pack from a zipfile or from the filesystem."""
         self.extend_extra.update(extend_extra or {})
@@ -1076,12 +1241,15 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         if merge_policy:
             self.merge_policy.extend(merge_policy)
 
+        lazy = False
+
         if origin and not isinstance(origin, Mapping):
             if not isinstance(origin, ZipFile):
-                origin = Path(origin).resolve()
+                origin = _absolute_path(origin, resolve_symlinks)
                 self.path = origin.parent
                 if origin.is_file():
-                    origin = ZipFile(origin)
+                    origin = _open_zipfile(origin)
+                    lazy = True
                 elif not origin.is_dir():
                     self.name = origin.name
                     self.zipped = origin.suffix == ".zip"
@@ -1096,27 +1264,46 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
                 self.name = self.name[:-4]
 
         if origin:
-            self.mount("", origin)
+            self.mount("", origin, lazy)
 
         if not self.pack_format:
             self.pack_format = self.latest_pack_format
         if not self.description:
             self.description = ""
 
-    def mount(self, prefix: str, origin: FileOrigin):
+    def load_url(
+        self,
+        url: str,
+        segment_size: int = 4 << 20,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = 30,
+    ):
+        """Download and load a zipped pack, fetching segments in parallel if possible."""
+        self.load(ZipFile(_download_url(url, segment_size, max_workers, timeout)))
+
+        name = PurePosixPath(unquote(urlparse(url).path)).name
+        self.name = (name[:-4] if name.endswith(".zip") else name) or None
+
+    def mount(self, prefix: str, origin: FileOrigin, lazy: bool = False):
         """Mount files from a zipfile or from the filesystem."""
         files: Dict[str, PackFile] = {}
+        entries = _list_directory_entries(origin)
 
         for filename, file_type in self.resolve_extra_info().items():
             if not prefix:
-                if loaded := file_type.try_load(origin, filename):
-                    files[filename] = loaded
+                path = filename
             elif prefix == filename:
-                if loaded := file_type.try_load(origin, ""):
-                    files[filename] = loaded
+                path = ""
             elif filename.startswith(prefix + "/"):
-                if loaded := file_type.try_load(origin, filename[len(prefix) + 1 :]):
-                    files[filename] = loaded
+                path = filename[len(prefix) + 1 :]
+            else:
+                continue
+
+            if path and entries is not None and path.partition("/")[0] not in entries:
+                continue
+
+            if loaded := file_type.try_load(origin, path):
+                files[filename] = loaded
 
         self.extra.merge(files)
 
@@ -1127,15 +1314,21 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
                 origin,
                 self.extend_namespace,
                 self.extend_namespace_extra,
+                lazy,
             )
         }
 
         self.merge(namespaces)  # type: ignore
 
-    def unveil(self, prefix: str, origin: Union[FileSystemPath, UnveilMapping]):
+    def unveil(
+        self,
+        prefix: str,
+        origin: Union[FileSystemPath, UnveilMapping],
+        resolve_symlinks: bool = False,
+    ):
         """Lazily mount resources from the root of a pack on the filesystem."""
         if not isinstance(origin, UnveilMapping):
-            origin = Path(origin).resolve()
+            origin = _absolute_path(origin, resolve_symlinks)
 
         mounted = self.unveiled.setdefault(origin, set())
 
@@ -1157,13 +1350,17 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         else:
             self.mount(prefix, origin / prefix)
 
-    def dump(self, origin: FileOrigin):
+    def dump(self, origin: FileOrigin, parallel: bool = True):
         """Write the content of the pack to a zipfile or to the filesystem"""
-        extra = {path: item for path, item in self.extra.items()}
-        _dump_files(origin, extra)
+        with (
+            ThreadPoolExecutor(max_workers=_max_workers)
+            if parallel and _max_workers > 1 and not isinstance(origin, Mapping)
+            else nullcontext()
+        ) as executor:
+            _dump_files(origin, self.extra.items(), executor)
 
-        for namespace_name, namespace in self.items():
-            namespace.dump(namespace_name, origin)
+            for namespace_name, namespace in self.items():
+                namespace.dump(namespace_name, origin, executor)
 
     def save(
         self,
@@ -1173,6 +1370,7 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         compression: Optional[Literal["none", "deflate", "bzip2", "lzma"]] = None,
         compression_level: Optional[int] = None,
         overwrite: Optional[bool] = False,
+        parallel: bool = True,
     ) -> Path:
         """Save the pack at the specified location."""
         if path:
@@ -1206,9 +1404,15 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         self.path = Path(directory).resolve()
 
         if not self.name:
+            existing: Set[str] = set()
+            try:
+                with os.scandir(self.path) as entries:
+                    existing = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                pass
             for i in count():
                 self.name = self.default_name + (str(i) if i else "")
-                if not (self.path / f"{self.name}{suffix}").exists():
+                if f"{self.name}{suffix}" not in existing:
                     break
 
         output_path = self.path / f"{self.name}{suffix}"
@@ -1227,7 +1431,7 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
             output_path.mkdir(parents=True, exist_ok=True)
 
         with factory(output_path) as pack:
-            self.dump(pack)
+            self.dump(pack, parallel)
 
         return output_path
 
@@ -1238,15 +1442,190 @@ class Pack(MatchMixin, MergeMixin, Container[str, NamespaceType]):
         )
 
 
-def _dump_files(origin: FileOrigin, files: Mapping[str, PackFile]):
-    dirs: DefaultDict[Tuple[str, ...], List[Tuple[str, PackFile]]] = defaultdict(list)
+def _dump_files(
+    origin: FileOrigin,
+    files: Iterable[Tuple[str, PackFile]],
+    executor: Optional[Executor] = None,
+):
+    dirs: DefaultDict[str, Dict[str, PackFile]] = defaultdict(dict)
 
-    for full_path, item in files.items():
+    for full_path, item in files:
         directory, _, filename = full_path.rpartition("/")
-        dirs[(directory,) if directory else ()].append((filename, item))
+        dirs[directory][filename] = item
 
-    for directory, entries in dirs.items():
-        if not isinstance(origin, (ZipFile, Mapping)):
-            Path(origin, *directory).resolve().mkdir(parents=True, exist_ok=True)
-        for filename, f in entries:
-            f.dump(origin, "/".join(directory + (filename,)))
+    if not isinstance(origin, (ZipFile, Mapping)):
+        created: Set[str] = set()
+        for directory in sorted(dirs, key=len, reverse=True):
+            if directory in created:
+                continue
+            Path(origin, directory).mkdir(parents=True, exist_ok=True)
+            while directory not in created:
+                created.add(directory)
+                directory = directory.rpartition("/")[0]
+
+    entries = [
+        (f"{directory}/{filename}" if directory else filename, f)
+        for directory, dir_entries in dirs.items()
+        for filename, f in dir_entries.items()
+    ]
+
+    if executor is None or len(entries) < 2 or isinstance(origin, Mapping):
+        for path, f in entries:
+            f.dump(origin, path)
+    elif isinstance(origin, ZipFile):
+        # Zipfiles can't be written concurrently so only serialization is moved
+        # to worker threads. Files backed by a source path are copied as-is and
+        # don't need to be serialized.
+        futures = [
+            executor.submit(f.ensure_serialized)
+            for _, f in entries
+            if not f.source_path
+        ]
+        for future in futures:
+            future.result()
+        for path, f in entries:
+            f.dump(origin, path)
+    else:
+        futures = [executor.submit(f.dump, origin, path) for path, f in entries]
+        for future in futures:
+            future.result()
+
+
+def _download_url(
+    url: str,
+    segment_size: int,
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> io.BytesIO:
+    try:
+        with urlopen(Request(url, method="HEAD"), timeout=timeout) as response:
+            size = int(response.headers.get("Content-Length") or 0)
+            ranged = response.headers.get("Accept-Ranges") == "bytes"
+    except (OSError, ValueError):
+        size, ranged = 0, False
+
+    if ranged and size > segment_size:
+        # Segments are written straight into the buffer of the returned file to
+        # avoid copying the whole archive once it's downloaded.
+        data = io.BytesIO()
+        data.seek(size - 1)
+        data.write(b"\0")
+
+        with data.getbuffer() as view:
+
+            def fetch(start: int) -> bool:
+                stop = min(start + segment_size, size)
+                request = Request(url, headers={"Range": f"bytes={start}-{stop - 1}"})
+                try:
+                    with urlopen(request, timeout=timeout) as response:
+                        if response.status != 206:
+                            return False
+                        chunk = response.read()
+                except OSError:
+                    return False
+                if len(chunk) != stop - start:
+                    return False
+                view[start:stop] = chunk
+                return True
+
+            with ThreadPoolExecutor(max_workers) as executor:
+                success = all(executor.map(fetch, range(0, size, segment_size)))
+
+        if success:
+            data.seek(0)
+            return data
+
+    with urlopen(url, timeout=timeout) as response:
+        return io.BytesIO(response.read())
+
+
+def _absolute_path(path: FileSystemPath, resolve_symlinks: bool = False) -> Path:
+    path = Path(path)
+    # Only the filesystem knows what ".." refers to when symlinks are involved.
+    if resolve_symlinks or ".." in path.parts:
+        return path.resolve()
+    return path.absolute()
+
+
+def _ordered_keys(lhs: Mapping[T, Any], rhs: Mapping[T, Any]) -> List[T]:
+    lhs_keys = set(lhs)
+    rhs_keys = set(rhs)
+    return [*(lhs_keys ^ rhs_keys), *(lhs_keys & rhs_keys)]
+
+
+def _file_digest(item: PackFile) -> bytes:
+    if (
+        isinstance(item, BinaryFileBase)
+        and item._content is item.source_zip is None  # type: ignore
+        and item.source_start is item.source_stop is None
+        and item.reader == item.from_path
+    ):
+        with open(item.ensure_source_path(), "rb") as f:
+            if file_digest := getattr(hashlib, "file_digest", None):
+                return file_digest(f, "sha256").digest()
+            file_hash = hashlib.sha256()
+            while chunk := f.read(1 << 20):
+                file_hash.update(chunk)
+            return file_hash.digest()
+
+    raw = item.serialize(item.get_content())
+    return hashlib.sha256(raw.encode() if isinstance(raw, str) else raw).digest()
+
+
+def _open_zipfile(path: Path) -> ZipFile:
+    # The archive is read into memory so that lazily loaded files don't depend
+    # on the file on disk staying open and unmodified.
+    zipfile = ZipFile(io.BytesIO(path.read_bytes()))
+    zipfile.filename = str(path)
+    return zipfile
+
+
+@contextmanager
+def _thread_local_zipfile(origin: ZipFile) -> Iterator[Callable[[], ZipFile]]:
+    if (
+        origin.mode != "r"
+        or origin.pwd is not None
+        or origin._filePassed  # type: ignore
+        or not origin.filename
+    ):
+        # Only archives opened from their filename can be reopened without
+        # losing file objects, pending writes or passwords.
+        yield lambda: origin
+        return
+
+    filename = origin.filename
+    local = threading.local()
+    handles: List[ZipFile] = []
+
+    def get_zipfile() -> ZipFile:
+        if (handle := getattr(local, "handle", None)) is None:
+            handle = local.handle = ZipFile(filename)
+            handles.append(handle)
+        return handle
+
+    try:
+        yield get_zipfile
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _list_directory_entries(origin: FileOrigin) -> Optional[Set[str]]:
+    if isinstance(origin, (ZipFile, Mapping)):
+        return None
+    try:
+        with os.scandir(origin) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _list_extensions(basename: str) -> Tuple[str, ...]:
+    stripped = basename.lstrip(".")
+    dot = stripped.find(".")
+    return () if dot < 0 else _list_suffix_extensions(stripped[dot:])
+
+
+@lru_cache(maxsize=4096)
+def _list_suffix_extensions(suffix: str) -> Tuple[str, ...]:
+    return tuple(list_extensions(PurePosixPath(f"_{suffix}")))
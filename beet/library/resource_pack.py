@@ -23,9 +23,8 @@ __all__ = [
 
 
 from contextlib import suppress
-from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, Optional, Tuple, Type
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 try:
     from PIL.Image import Image
@@ -62,17 +61,37 @@ class Model(JsonFile):
 
     def merge(self, other: "Model") -> bool:  # type: ignore
         overrides = self.data.get("overrides", [])
-        merged_overrides = deepcopy(overrides)
+        merged_overrides = _clone_json(overrides)
+
+        index: Optional[Dict[Any, int]] = {}
+        try:
+            for i, override in enumerate(overrides):
+                index.setdefault(_predicate_key(override.get("predicate")), i)
+        except TypeError:
+            index = None
 
         for other_override in other.data.get("overrides", []):
             other_predicate = other_override.get("predicate")
 
-            for i, override in enumerate(overrides):
-                if override.get("predicate") == other_predicate:
-                    merged_overrides[i]["model"] = other_override["model"]
-                    break
+            if index is not None:
+                try:
+                    i = index.get(_predicate_key(other_predicate))
+                except TypeError:
+                    i = None
             else:
+                i = next(
+                    (
+                        i
+                        for i, override in enumerate(overrides)
+                        if override.get("predicate") == other_predicate
+                    ),
+                    None,
+                )
+
+            if i is None:
                 merged_overrides.append(other_override)
+            else:
+                merged_overrides[i]["model"] = other_override["model"]
 
         self.data = dict(other.data)
         if merged_overrides:
@@ -102,7 +121,7 @@ class Font(JsonFile):
         providers = self.data.setdefault("providers", [])
 
         for provider in other.data.get("providers", []):
-            providers.append(deepcopy(provider))
+            providers.append(_clone_json(provider))
         return True
 
 
@@ -228,30 +247,21 @@ class Sound(BinaryFile):
             if self.subtitle is not None:
                 event["subtitle"] = self.subtitle
 
-            pack[namespace].extra.merge(
-                {"sounds.json": SoundConfig({self.event: event})}
-            )
+            if pack.bind_batch is None:
+                pack[namespace].extra.merge(
+                    {"sounds.json": SoundConfig({self.event: event})}
+                )
+            else:
+                pack.bind_batch[_flush_sound_events].append(
+                    (namespace, self.event, event)
+                )
 
 
 class SoundConfig(JsonFile):
     """Class representing the sounds.json configuration."""
 
     def merge(self, other: "SoundConfig") -> bool:  # type: ignore
-        for key, other_event in other.data.items():
-            if other_event.get("replace"):
-                self.data[key] = deepcopy(other_event)
-                continue
-
-            event = self.data.setdefault(key, {})
-
-            if subtitle := other_event.get("subtitle"):
-                event["subtitle"] = subtitle
-
-            sounds = event.setdefault("sounds", [])
-            for sound in other_event.get("sounds", []):
-                if sound not in sounds:
-                    sounds.append(deepcopy(sound))
-
+        _merge_sound_events(self.data, other.data.items())
         return True
 
 
@@ -270,10 +280,12 @@ class Atlas(JsonFile):
 
     def merge(self, other: "Atlas") -> bool:  # type: ignore
         values = self.data.setdefault("sources", [])
+        existing = {_json_key(value) for value in values}
 
         for value in other.data.get("sources", []):
-            if value not in values:
-                values.append(deepcopy(value))
+            if (value_key := _json_key(value)) not in existing:
+                existing.add(value_key)
+                values.append(_clone_json(value))
         return True
 
     def append(self, other: "Atlas"):
@@ -283,10 +295,12 @@ class Atlas(JsonFile):
     def prepend(self, other: "Atlas"):
         """Prepend values from another atlas."""
         values = self.data.setdefault("sources", [])
+        existing = {_json_key(value) for value in values}
 
         for value in other.data.get("sources", []):
-            if value not in values:
-                values.insert(0, deepcopy(value))
+            if (value_key := _json_key(value)) not in existing:
+                existing.add(value_key)
+                values.insert(0, _clone_json(value))
 
     def add(self, value: JsonDict):
         """Add an entry."""
@@ -383,3 +397,80 @@ class ResourcePack(Pack[ResourcePackNamespace]):
     particles:        NamespaceProxyDescriptor[Particle]       = NamespaceProxyDescriptor(Particle)
     atlases:          NamespaceProxyDescriptor[Atlas]          = NamespaceProxyDescriptor(Atlas)
     # fmt: on
+
+
+def _clone_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _clone_json(v) for k, v in value.items()}  # type: ignore
+    if isinstance(value, list):
+        return [_clone_json(v) for v in value]  # type: ignore
+    return value
+
+
+def _json_key(value: Any) -> Any:
+    # Hashable key that compares like the json value itself, so 1 == 1.0 == True.
+    if isinstance(value, dict):
+        return frozenset((k, _json_key(v)) for k, v in value.items())  # type: ignore
+    if isinstance(value, list):
+        return tuple(_json_key(v) for v in value)  # type: ignore
+    return value
+
+
+def _predicate_key(predicate: Any) -> Any:
+    if isinstance(predicate, dict):
+        return tuple(sorted(predicate.items()))  # type: ignore
+    return predicate
+
+
+def _merge_sound_events(data: JsonDict, events: Iterable[Tuple[str, JsonDict]]):
+    existing: Dict[str, Set[Any]] = {}
+
+    for key, other_event in events:
+        if other_event.get("replace"):
+            data[key] = _clone_json(other_event)
+            existing.pop(key, None)
+            continue
+
+        event = data.setdefault(key, {})
+
+        if subtitle := other_event.get("subtitle"):
+            event["subtitle"] = subtitle
+
+        sounds = event.setdefault("sounds", [])
+
+        if (sound_keys := existing.get(key)) is None:
+            sound_keys = existing[key] = {_json_key(sound) for sound in sounds}
+
+        for sound in other_event.get("sounds", []):
+            if (sound_key := _json_key(sound)) not in sound_keys:
+                sound_keys.add(sound_key)
+                sounds.append(_clone_json(sound))
+
+
+def _flush_sound_events(pack: ResourcePack, items: List[Tuple[str, str, JsonDict]]):
+    events: Dict[str, List[Tuple[str, JsonDict]]] = {}
+    for namespace, key, event in items:
+        events.setdefault(namespace, []).append((key, event))
+
+    sequential = bool(pack.merge_policy.namespace_extra.get("sounds.json"))
+
+    for namespace, namespace_events in events.items():
+        extra = pack[namespace].extra
+        config = extra.get("sounds.json")
+
+        if config is None and not sequential:
+            key, event = namespace_events.pop(0)
+            extra.merge({"sounds.json": SoundConfig({key: event})})
+            config = extra["sounds.json"]
+
+        # Merge rules and custom sound configs need to see every event.
+        if (
+            sequential
+            or not isinstance(config, SoundConfig)
+            or type(config).merge is not SoundConfig.merge
+        ):
+            for key, event in namespace_events:
+                extra.merge({"sounds.json": SoundConfig({key: event})})
+            continue
+
+        _merge_sound_events(config.data, namespace_events)
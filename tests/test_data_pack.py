@@ -1,6 +1,13 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Iterator, List, Tuple
+from zipfile import ZipFile
+
+import pytest
 
 from beet import (
     BlockTag,
@@ -145,6 +152,256 @@ def test_context_manager_zipped(tmp_path: Path):
     assert p2 == p1
 
 
+def test_lazy_zipped(tmp_path: Path):
+    with DataPack(path=tmp_path / "foobar.zip") as p1:
+        p1["hello:world"] = Function(["say hello"])
+
+    p2 = DataPack(path=tmp_path / "foobar.zip")
+    function = p2.functions["hello:world"]
+    assert function.source_zip and function.source_zip[1].endswith("world.mcfunction")
+
+    assert p2 == p1
+
+    function.lines.append("say world")
+    assert function.source_zip is None
+    assert function.original.source_zip
+    assert function.original.get_content() == "say hello\n"
+
+    p2.save(path=tmp_path / "output")
+    assert DataPack(path=tmp_path / "output") == p2
+
+
+def test_lazy_zipped_dump_to_source(tmp_path: Path):
+    with DataPack(path=tmp_path / "foobar.zip") as p1:
+        for i in range(5):
+            p1[f"hello:world{i}"] = Function([f"say {j}" for j in range(i, 10000, 5)])
+
+    p2 = DataPack(path=tmp_path / "foobar.zip")
+    with ZipFile(tmp_path / "foobar.zip", "w") as zipfile:
+        p2.dump(zipfile)
+    assert DataPack(path=tmp_path / "foobar.zip") == p1
+
+    with DataPack(path=tmp_path / "foobar.zip") as p3:
+        p3.functions["hello:world0"].lines.append("say world")
+    p1.functions["hello:world0"].lines.append("say world")
+    assert DataPack(path=tmp_path / "foobar.zip") == p1
+
+
+def test_lazy_zipped_truncated(tmp_path: Path):
+    with DataPack(path=tmp_path / "foobar.zip") as p1:
+        for i in range(5):
+            p1[f"hello:world{i}"] = Function([f"say {j}" for j in range(i, 10000, 5)])
+
+    p2 = DataPack(path=tmp_path / "foobar.zip")
+    with open(tmp_path / "foobar.zip", "r+b") as f:
+        f.truncate(0)
+
+    assert p2 == p1
+
+
+def test_parallel_load_appended_zip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("beet.library.base._max_workers", 8)
+
+    with DataPack(path=tmp_path / "foobar.zip") as p1:
+        p1["a:old"] = Function(["say old"])
+        p1["a:old2"] = Function(["say old2"])
+
+    with ZipFile(tmp_path / "foobar.zip", "a") as zipfile:
+        zipfile.writestr("data/a/functions/new.mcfunction", "say new\n")
+        p2 = DataPack(zipfile=zipfile)
+
+    assert list(p2.functions) == ["a:new", "a:old", "a:old2"]
+    assert p2.functions["a:new"].text == "say new\n"
+
+
+def test_parallel_dump(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("beet.library.base._max_workers", 8)
+
+    executors: List[ThreadPoolExecutor] = []
+
+    class TrackedExecutor(ThreadPoolExecutor):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    monkeypatch.setattr("beet.library.base.ThreadPoolExecutor", TrackedExecutor)
+
+    p1 = DataPack()
+    for i in range(20):
+        p1[f"hello:world{i}"] = Function([f"say {i}"], tags=["minecraft:load"])
+        p1[f"hello:nested/thing{i}"] = Structure({"size": [i, 2, 3]})
+        p1[f"other{i}:thing"] = Function([f"say {i}"])
+        p1[f"other{i}:thing2"] = Function([f"say {i}"])
+
+    assert DataPack(path=p1.save(tmp_path / "directory")) == p1
+    assert len(executors) == 1
+
+    zipped = p1.save(tmp_path / "zipped", zipped=True)
+    p2 = DataPack(path=zipped)
+    assert p2.functions["hello:world0"].source_zip
+    assert DataPack(path=p2.save(tmp_path / "directory2")) == p1
+
+    p3 = DataPack(path=zipped)
+    assert p3.functions["hello:world0"].source_zip
+    assert DataPack(path=p3.save(tmp_path / "zipped2", zipped=True)) == p1
+
+
+def test_parallel_scan(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("beet.library.base._max_workers", 8)
+
+    p1 = DataPack()
+    for i in range(20):
+        p1[f"hello:world{i}"] = Function([f"say {i}"], tags=["minecraft:load"])
+    p1.save(path=tmp_path / "foobar.zip")
+
+    with ZipFile(tmp_path / "foobar.zip") as zipfile:
+        p2 = DataPack(zipfile=zipfile)
+
+    assert p2 == p1
+    assert all(f.source_zip is None for f in p2.functions.values())
+
+
+def test_parallel_scan_file_object(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("beet.library.base._max_workers", 8)
+
+    p1 = DataPack()
+    for i in range(20):
+        p1[f"hello:world{i}"] = Function([f"say {i}"])
+    path = p1.save(path=tmp_path / "foobar.zip")
+
+    with ZipFile(io.BytesIO(path.read_bytes())) as zipfile:
+        zipfile.filename = str(path)
+        DataPack().save(path=path, overwrite=True)
+        p2 = DataPack(zipfile=zipfile)
+
+    assert p2 == p1
+
+
+def test_load_symlink(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    with DataPack(path=tmp_path / "foobar") as p1:
+        p1["hello:world"] = Function(["say hello"])
+
+    (tmp_path / "link").symlink_to(tmp_path / "foobar")
+
+    p2 = DataPack()
+    p2.load(tmp_path / "link")
+    assert p2.name == "link"
+    assert p2.path == tmp_path
+    assert p2.functions["hello:world"] == p1.functions["hello:world"]
+
+    p3 = DataPack()
+    p3.load(tmp_path / "link", resolve_symlinks=True)
+    assert p3.name == "foobar"
+
+    with DataPack(path=tmp_path / "real" / "pack") as p4:
+        p4["a:f"] = Function(["say real"])
+    DataPack(path=tmp_path / "pack").save()
+    (tmp_path / "real" / "sub").mkdir()
+    (tmp_path / "sub_link").symlink_to(tmp_path / "real" / "sub")
+
+    p5 = DataPack(path=tmp_path / "sub_link" / ".." / "pack")
+    assert p5.functions["a:f"] == p4.functions["a:f"]
+
+    monkeypatch.chdir(tmp_path / "real" / "sub")
+    p6 = DataPack(path="..")
+    assert p6.name == "real"
+    assert p6.path == tmp_path
+
+
+def test_load_url(tmp_path: Path):
+    with DataPack(path=tmp_path / "foo bar.zip") as p1:
+        p1["hello:world"] = Function(["say hello"])
+
+    p2 = DataPack()
+    p2.load_url((tmp_path / "foo bar.zip").as_uri())
+    assert p2.name == "foo bar"
+    assert p2.functions["hello:world"] == p1.functions["hello:world"]
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    data: ClassVar[bytes] = b""
+    ranges: ClassVar[List[str]] = []
+    fail_ranges: ClassVar[bool] = False
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.data)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        data = self.data
+        if byte_range := self.headers.get("Range"):
+            self.ranges.append(byte_range)
+            if self.fail_ranges:
+                self.send_error(500)
+                return
+            start, stop = map(int, byte_range[len("bytes=") :].split("-"))
+            data = data[start : stop + 1]
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+@pytest.fixture
+def range_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/foobar.zip"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("fail_ranges", [False, True])
+def test_load_url_ranges(
+    tmp_path: Path,
+    range_server: str,
+    monkeypatch: pytest.MonkeyPatch,
+    fail_ranges: bool,
+):
+    p1 = DataPack("foobar")
+    for i in range(20):
+        p1[f"hello:world{i}"] = Function([f"say {j}" for j in range(i, 1000, 20)])
+    data = p1.save(tmp_path, zipped=True).read_bytes()
+
+    monkeypatch.setattr(RangeRequestHandler, "data", data)
+    monkeypatch.setattr(RangeRequestHandler, "ranges", [])
+    monkeypatch.setattr(RangeRequestHandler, "fail_ranges", fail_ranges)
+
+    p2 = DataPack()
+    p2.load_url(range_server, segment_size=1024, timeout=10)
+    assert p2.name == "foobar"
+    assert p2 == p1
+    segments = -(-len(data) // 1024)
+    if fail_ranges:
+        # Pending segments are cancelled once one of them fails.
+        assert 1 <= len(RangeRequestHandler.ranges) <= segments
+    else:
+        assert len(RangeRequestHandler.ranges) == segments
+
+
+def test_content_hash(tmp_path: Path):
+    p1 = DataPack()
+    p1["hello:world"] = Function(["say hello"], tags=["minecraft:load"])
+    p1["hello:thing"] = Structure({"size": [1, 2, 3]})
+
+    p2 = DataPack(path=p1.save(tmp_path))
+    p3 = DataPack(path=p1.save(tmp_path, zipped=True))
+    assert p1.content_hash() == p2.content_hash() == p3.content_hash()
+
+    p2.functions["hello:world"].lines.append("say world")
+    assert p1.content_hash() != p2.content_hash()
+
+
 def test_vanilla_compare(minecraft_data_pack: Path):
     assert DataPack(path=minecraft_data_pack) == DataPack(path=minecraft_data_pack)
 
@@ -446,6 +703,44 @@ def test_merge_nuke():
     assert p1["thing"].extra["foo.json"] == JsonFile()
 
 
+def test_merge_policy_copy():
+    def nuke(*args: Any) -> bool:
+        raise Drop()
+
+    policy = MergePolicy(extra={"pack.mcmeta": [nuke]})
+    pack = DataPack(merge_policy=policy)
+    pack.merge_policy.extend_extra("pack.mcmeta", nuke)
+
+    assert policy.extra["pack.mcmeta"] == [nuke]
+    assert pack.merge_policy.extra["pack.mcmeta"] == [nuke, nuke]
+
+
+def test_resolve_cache():
+    class Blueprint(JsonFile):
+        scope: ClassVar[Tuple[str, ...]] = ("blueprints",)
+        extension: ClassVar[str] = ".json"
+
+    pack = DataPack()
+    scope_map = pack.resolve_scope_map()
+    extra_info = pack.resolve_extra_info()
+
+    assert pack.resolve_scope_map() is scope_map
+    assert pack.resolve_extra_info() is extra_info
+
+    with pytest.raises(TypeError):
+        extra_info["thing.json"] = JsonFile  # type: ignore
+    with pytest.raises(TypeError):
+        pack.resolve_namespace_extra_info()["thing.json"] = JsonFile  # type: ignore
+
+    pack.extend_namespace.append(Blueprint)
+    pack.extend_extra["thing.json"] = JsonFile
+
+    assert pack.resolve_scope_map()[("blueprints",), ".json"] is Blueprint
+    assert pack.resolve_extra_info()["thing.json"] is JsonFile
+    assert (("blueprints",), ".json") not in scope_map
+    assert "thing.json" not in extra_info
+
+
 def test_merge_filter():
     p1 = DataPack(filter={"block": [{"namespace": "foo"}]})
     p2 = DataPack(filter={"block": [{"namespace": "bar"}]})
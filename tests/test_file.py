@@ -1,12 +1,15 @@
 import json
+from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
-from typing import List, Literal, Union
+from typing import Any, List, Literal, Union
+from zipfile import ZIP_DEFLATED, ZipFile
 
 import pytest
 from pydantic import BaseModel, Field
 from typing_extensions import Annotated
 
-from beet import BinaryFile, JsonFileBase, TextFile
+from beet import BinaryFile, JsonFile, JsonFileBase, SerializationError, TextFile
 
 
 def test_text_range(tmp_path: Path):
@@ -25,6 +28,31 @@ def test_binary_range(tmp_path: Path):
     assert BinaryFile(source_path=p1, source_start=1, source_stop=2).blob == b"b"
 
 
+def test_range_dump(tmp_path: Path):
+    p1 = tmp_path / "p1"
+    p1.write_bytes(b"abc")
+    BinaryFile(source_path=p1).dump(tmp_path, "p2")
+    BinaryFile(source_path=p1, source_start=1).dump(tmp_path, "p3")
+    BinaryFile(source_path=p1, source_start=1, source_stop=2).dump(tmp_path, "p4")
+    TextFile(source_path=p1, source_stop=2).dump(tmp_path, "p5")
+    assert (tmp_path / "p2").read_bytes() == b"abc"
+    assert (tmp_path / "p3").read_bytes() == b"bc"
+    assert (tmp_path / "p4").read_bytes() == b"b"
+    assert (tmp_path / "p5").read_text() == "ab"
+
+
+def test_zip_dump(tmp_path: Path):
+    with ZipFile(tmp_path / "p1.zip", "w", ZIP_DEFLATED) as zf:
+        TextFile("abc").dump(zf, "p2")
+        BinaryFile(b"abc").dump(zf, "p3")
+
+    with ZipFile(tmp_path / "p1.zip") as zf:
+        for info in zf.infolist():
+            assert info.date_time == (1980, 1, 1, 0, 0, 0)
+            assert info.compress_type == ZIP_DEFLATED
+        assert zf.read("p3") == b"abc"
+
+
 def test_original(tmp_path: Path):
     p1 = tmp_path / "p1"
     p1.write_text("abc")
@@ -98,3 +126,57 @@ def test_model(data: str):
 def test_copy():
     assert TextFile(source_path="foo.txt").copy().source_path == "foo.txt"
     assert TextFile("hello").copy().text == "hello"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": [1, 2.5, True, None], "b": {}, "c": []},
+        {"small": 1e-05, "large": 1e16, "nan": float("nan")},
+        {"text": "café \x7f \n ☃", "big": 2**70},
+        {1: "non-string key"},
+    ],
+)
+def test_json_encoding(data: Any):
+    assert JsonFile(data).text == json.dumps(data, indent=2) + "\n"
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Name(str):
+    pass
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"date": date(2020, 1, 1)},
+        {"datetime": datetime(2020, 1, 1)},
+        {"point": Point(1, 2)},
+    ],
+)
+def test_json_encoding_unsupported(data: Any):
+    with pytest.raises(SerializationError):
+        JsonFile(data).text
+
+
+def test_json_encoding_subclass():
+    assert JsonFile({Name("a"): Name("b")}).text == '{\n  "a": "b"\n}\n'
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"seed": 123456789012345678901234567890}',
+        '{"low": -9223372036854775809, "high": 18446744073709551615}',
+        '{"max": 9223372036854775807, "value": 0.1234567890123456789}',
+    ],
+)
+def test_json_decoding(text: str):
+    f = JsonFile(text)
+    assert f.data == json.loads(text)
+    assert f.text == json.dumps(json.loads(text), indent=2) + "\n"
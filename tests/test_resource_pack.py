@@ -4,7 +4,7 @@ import pytest
 from PIL import Image, ImageDraw
 from pytest_insta import SnapshotFixture
 
-from beet import Mcmeta, PngFile, ResourcePack, Sound, SoundConfig, Texture
+from beet import Atlas, Mcmeta, PngFile, ResourcePack, Sound, SoundConfig, Texture
 
 
 def test_default():
@@ -100,6 +100,77 @@ def test_sounds():
     assert pack["minecraft"].sound_config == SoundConfig(config)
 
 
+def test_sounds_numeric_dedup():
+    config = SoundConfig({"event": {"sounds": [{"name": "a", "volume": 1}, "b"]}})
+    config.merge(
+        SoundConfig(
+            {"event": {"sounds": [{"volume": 1.0, "name": "a"}, {"name": "c"}]}}
+        )
+    )
+    assert config.data["event"]["sounds"] == [
+        {"name": "a", "volume": 1},
+        "b",
+        {"name": "c"},
+    ]
+
+    config = SoundConfig({"event": {"sounds": [{"name": "a", "stream": True}]}})
+    config.merge(SoundConfig({"event": {"sounds": [{"name": "a", "stream": 1}]}}))
+    assert config.data["event"]["sounds"] == [{"name": "a", "stream": True}]
+
+
+def test_atlas_numeric_dedup():
+    atlas = Atlas({"sources": [{"type": "single", "resource": "a", "x": [1, 2]}]})
+    atlas.merge(
+        Atlas({"sources": [{"x": [1.0, 2], "resource": "a", "type": "single"}]})
+    )
+    atlas.prepend(
+        Atlas({"sources": [{"type": "single", "resource": "a", "x": [1, 2.0]}]})
+    )
+    assert len(atlas.data["sources"]) == 1
+
+
+def test_sounds_batch_bind():
+    p1 = ResourcePack()
+    p2 = ResourcePack()
+
+    with p2.batch_bind():
+        for pack in [p1, p2]:
+            for i in range(10):
+                pack[f"demo:sound_{i}"] = Sound(
+                    b"", event=f"event_{i % 3}", subtitle=f"foo_{i}", volume=i / 10
+                )
+            pack["demo:sound_3"] = Sound(b"", event="event_0", volume=0.3)
+            pack["demo:sound_4"] = Sound(b"", event="event_2", replace=True)
+
+        assert "sounds.json" not in p2["demo"].extra
+
+    assert p1["demo"].sound_config == p2["demo"].sound_config
+    assert p1["demo"].sound_config.data["event_2"] == {  # type: ignore
+        "sounds": ["sound_4"],
+        "replace": True,
+    }
+
+
+def test_sounds_batch_bind_custom_config():
+    class CustomSoundConfig(SoundConfig):
+        def merge(self, other: SoundConfig) -> bool:  # type: ignore
+            self.data.setdefault("merged", []).extend(other.data)
+            return super().merge(other)
+
+    pack = ResourcePack()
+    pack["demo"].extra["sounds.json"] = CustomSoundConfig({})
+
+    with pack.batch_bind():
+        pack["demo:a"] = Sound(b"", event="event_a")
+        pack["demo:b"] = Sound(b"", event="event_b")
+
+    assert pack["demo"].sound_config.data == {  # type: ignore
+        "merged": ["event_a", "event_b"],
+        "event_a": {"sounds": ["a"]},
+        "event_b": {"sounds": ["b"]},
+    }
+
+
 def test_merge(snapshot: SnapshotFixture):
     p1 = ResourcePack("p1")
     p1["custom:red"] = Texture(Image.new("RGB", (32, 32), color="red"))